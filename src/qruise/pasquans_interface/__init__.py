@@ -1,36 +1,73 @@
-import sys
-
-from qruise.pasquans_interface.mock_simulator import MockSimulator, MockSimulatorV2
-from qruise.pasquans_interface.mock_provider import MockProvider
-from qruise.pasquans_interface.provider import PasquansProvider
-from qruise.pasquans_interface.simulator_backend import SimulatorBackend
-from qruise.pasquans_interface.simulate import simulate
-from qruise.pasquans_interface.units import ureg, Q_
-
-
 __all__ = [
     "MockSimulator",
     "MockSimulatorV2",
     "MockProvider",
     "PasquansProvider",
     "SimulatorBackend",
+    "BackendID",
+    "SimulationResult",
+    "format_error",
     "simulate",
+    "simulate_many",
+    "make_simulator",
+    "pair_distances",
+    "pulses_are_constant",
     "ureg",
     "Q_",
+    "validate_units",
 ]
 
+# Map each public name to the submodule that defines it. Submodules are only
+# imported on first attribute access (PEP 562), so a plain
+# `import qruise.pasquans_interface` does not pay for pint's unit-registry
+# construction or any other submodule it never touches.
+_LAZY = {
+    "MockSimulator": "qruise.pasquans_interface.mock_simulator",
+    "MockSimulatorV2": "qruise.pasquans_interface.mock_simulator",
+    "MockProvider": "qruise.pasquans_interface.mock_provider",
+    "PasquansProvider": "qruise.pasquans_interface.provider",
+    "SimulatorBackend": "qruise.pasquans_interface.simulator_backend",
+    "BackendID": "qruise.pasquans_interface.backend_id",
+    "SimulationResult": "qruise.pasquans_interface.result",
+    "format_error": "qruise.pasquans_interface.result",
+    "simulate": "qruise.pasquans_interface._simulate",
+    "make_simulator": "qruise.pasquans_interface._simulate",
+    "simulate_many": "qruise.pasquans_interface._simulate",
+    "pair_distances": "qruise.pasquans_interface._simulate",
+    "pulses_are_constant": "qruise.pasquans_interface._simulate",
+    "ureg": "qruise.pasquans_interface.units",
+    "Q_": "qruise.pasquans_interface.units",
+    "validate_units": "qruise.pasquans_interface.units",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+
+        module = importlib.import_module(_LAZY[name])
+        value = getattr(module, name)
+        # Cache the resolved symbol so subsequent accesses are plain
+        # module-dict lookups. No public name shares its submodule's name
+        # (the dispatcher lives in _simulate for exactly this reason), so
+        # the binding can never be shadowed by the module object.
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
-if sys.version_info[:2] >= (3, 8):
-    # TODO: Import directly (no need for conditional) when `python_requires = >= 3.8`
-    from importlib.metadata import PackageNotFoundError, version  # pragma: no cover
-else:
-    from importlib_metadata import PackageNotFoundError, version  # pragma: no cover
 
 try:
-    # Change here if project is renamed and does not equal the package name
-    dist_name = "qruise-pasquans-interface"
-    __version__ = version(dist_name)
-except PackageNotFoundError:  # pragma: no cover
-    __version__ = "unknown"
-finally:
-    del version, PackageNotFoundError
+    # Generated by setuptools-scm at build time (see pyproject.toml), so the
+    # version is a plain string literal and no metadata lookup happens here.
+    from qruise.pasquans_interface._version import __version__
+except ImportError:  # pragma: no cover
+    # Running from a raw checkout without a build step; fall back to a cached
+    # metadata lookup
+    from qruise.pasquans_interface._version_lookup import get_version
+
+    __version__ = get_version()
+    del get_version
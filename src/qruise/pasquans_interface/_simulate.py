@@ -0,0 +1,432 @@
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Tuple, Union
+
+import numpy as np
+
+from qruise.pasquans_interface.backend_id import BackendID, _ID_TO_NAME
+from qruise.pasquans_interface.provider import PasquansProvider
+from qruise.pasquans_interface.mock_provider import MockProvider
+from qruise.pasquans_interface.result import SimulationResult
+from qruise.pasquans_interface.simulator_backend import SimulatorBackend
+
+# Shared read-only mapping forwarded when the caller passes no backend
+# options; avoids allocating a fresh empty dict per call
+_EMPTY_OPTS = MappingProxyType({})
+
+# Result keys the dispatcher maps onto named SimulationResult fields
+_KNOWN_KEYS = ("state_populations", "backend_options")
+
+
+def _as_result(raw, backend_information) -> SimulationResult:
+    """Wrap a backend's raw return value into a `SimulationResult`.
+
+    Backends that already return a `SimulationResult` get the shared
+    backend-information mapping attached. Mapping returns keep every key:
+    anything beyond the recognized fields is carried in ``extra``, so
+    third-party backends reporting additional data are not silently
+    narrowed to the named fields.
+    """
+    if isinstance(raw, SimulationResult):
+        if raw.backend_information is None:
+            raw.backend_information = backend_information
+        return raw
+    extra = {k: v for k, v in raw.items() if k not in _KNOWN_KEYS}
+    return SimulationResult(
+        state_populations=raw.get("state_populations"),
+        backend_options=raw.get("backend_options"),
+        backend_information=backend_information,
+        extra=extra or None,
+    )
+
+
+def _as_float_array(values):
+    """Normalize a pulse/lattice argument to a contiguous float64 ndarray.
+
+    ``None`` and unit-carrying pint Quantities are passed through unchanged;
+    plain Python sequences are converted once here so backends receive
+    contiguous buffers instead of re-converting element by element.
+    """
+    if values is None or hasattr(values, "units"):
+        return values
+    if (
+        isinstance(values, np.ndarray)
+        and values.dtype == np.float64
+        and values.flags["C_CONTIGUOUS"]
+    ):
+        # Zero-copy fast path: already-conforming arrays pass through
+        # untouched, only deviating dtypes/layouts pay for a conversion
+        return values
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+@lru_cache(maxsize=128)
+def _to_state_vec(state: tuple, dtype=np.complex128) -> np.ndarray:
+    """Convert an initial-state tuple to a read-only complex state vector.
+
+    Sweeps typically reuse the same small initial state across thousands of
+    calls; memoizing on the hashable tuple form avoids re-allocating and
+    re-typing the same vector every time. The array is marked read-only so
+    the cached value cannot be corrupted by one caller for the next. The
+    dtype is part of the cache key, so single- and double-precision callers
+    get separate cached vectors.
+    """
+    vec = np.array(state, dtype=dtype)
+    vec.setflags(write=False)
+    return vec
+
+
+def _basis_state_index(state: tuple):
+    """Return the basis index if ``state`` is a computational-basis state.
+
+    A basis state has exactly one amplitude equal to 1.0 and all others 0.0;
+    anything else (superpositions, unnormalized or null states) returns
+    ``None``. Detecting this lets the dispatcher forward the caller's
+    lightweight sequence unchanged instead of building a dense complex state
+    vector that a populations-only backend never reads.
+    """
+    index = None
+    for i, amplitude in enumerate(state):
+        if amplitude == 1.0:
+            if index is not None:
+                return None
+            index = i
+        elif amplitude != 0.0:
+            return None
+    return index
+
+
+def _sites_as_array(lattice_sites):
+    """Normalize lattice sites to a contiguous (N, D) float64 ndarray.
+
+    ``None``, pint Quantities and existing ndarrays take the generic
+    :func:`_as_float_array` path. For the common list-of-tuples input,
+    ``np.fromiter`` over a flattening generator with an explicit dtype and
+    count skips NumPy's object-array dtype inference, which is several times
+    faster than ``np.array(list_of_tuples)`` for lattices of a few hundred
+    sites.
+    """
+    if lattice_sites is None or hasattr(lattice_sites, "units"):
+        # Quantities pass through unchanged so unit-aware backends keep the
+        # unit information; stripping to magnitudes here would break them
+        return lattice_sites
+    if isinstance(lattice_sites, np.ndarray):
+        sites = _as_float_array(lattice_sites)
+        assert sites.ndim == 2, "lattice_sites must have shape (N, D)"
+        return sites
+    if not lattice_sites:
+        return _as_float_array(lattice_sites)
+    n_sites = len(lattice_sites)
+    n_dim = len(lattice_sites[0])
+    return np.fromiter(
+        (coord for site in lattice_sites for coord in site),
+        dtype=np.float64,
+        count=n_sites * n_dim,
+    ).reshape(n_sites, n_dim)
+
+
+def pair_distances(lattice_sites) -> np.ndarray:
+    """Compute the (N, N) matrix of pairwise distances between lattice sites.
+
+    Backends that evaluate distance-dependent interaction terms (e.g. the
+    Rydberg van der Waals tail) need this matrix; a Python double loop over
+    sites is quadratic in interpreter overhead, while the broadcasted
+    difference combined with ``np.einsum`` runs the square-and-sum as one
+    fused pass over the displacement array.
+
+    Parameters
+    ----------
+    lattice_sites : list[Tuple[float]] or np.ndarray
+        The positions of atoms in the lattice, shape (N, D). Accepts the
+        same forms as `simulate`.
+
+    Returns
+    -------
+    np.ndarray
+        Symmetric float64 array of shape (N, N) with zeros on the diagonal.
+    """
+    sites = _sites_as_array(lattice_sites)
+    d = sites[:, None, :] - sites[None, :, :]
+    return np.sqrt(np.einsum("ijk,ijk->ij", d, d))
+
+
+def pulses_are_constant(*pulses) -> bool:
+    """Return True when every given time-dependent pulse is constant in time.
+
+    A general simulator rebuilds its gates on every timestep; when the Rabi
+    frequency, phase and detuning pulses are all flat — the common case in
+    calibration sweeps — a backend can instead build one propagator and
+    apply it repeatedly, a constant-factor saving proportional to the
+    timegrid length. This helper performs that detection once at the
+    dispatch boundary so backends can branch on it cheaply.
+
+    Parameters
+    ----------
+    *pulses : array_like or Quantity or None
+        Time-dependent pulse samples; ``None`` entries are ignored and pint
+        Quantities are compared on their magnitudes.
+
+    Returns
+    -------
+    bool
+        True when no pulse varies over its samples.
+    """
+    for pulse in pulses:
+        if pulse is None:
+            continue
+        arr = np.asarray(getattr(pulse, "magnitude", pulse))
+        if arr.size > 1 and not np.all(arr == arr.flat[0]):
+            return False
+    return True
+
+
+@lru_cache(maxsize=1)
+def _default_provider() -> MockProvider:
+    """Build the default provider once per process.
+
+    Provider construction instantiates every available backend via
+    ``_verify_backends()``, so callers that loop over ``simulate()`` without
+    passing a provider should not pay that cost on every call.
+    """
+    return MockProvider()
+
+
+def make_simulator(backend: str, provider: PasquansProvider = None):
+    """
+    Resolve a backend once and return a reusable simulation closure.
+
+    For optimizer inner loops and parameter sweeps that call `simulate` many
+    times against the same backend, this factory performs the provider/backend
+    resolution and the backend-information fetch a single time; the returned
+    closure only does the per-call input normalization and the backend call
+    itself.
+
+    Parameters
+    ----------
+    backend : str or BackendID
+        The name of the backend to resolve, or a `BackendID` tag for a
+        built-in backend.
+    provider : PasquansProvider, optional
+        The provider responsible for managing and retrieving backends. Defaults to a
+        process-wide cached MockProvider instance.
+
+    Returns
+    -------
+    Callable[..., SimulationResult]
+        A function with the same keyword interface as `simulate` minus the
+        `backend` and `provider` arguments.
+    """
+    if isinstance(backend, BackendID):
+        # Lower the integer tag to its registry name once, at entry
+        backend = _ID_TO_NAME[backend]
+    if provider is None:
+        provider = _default_provider()
+    backend_simulator: SimulatorBackend = provider.get_backend(backend)
+    backend_simulate = backend_simulator.simulate
+
+    # Backend information is static per instance (and cached there), so bake
+    # it into the closure instead of fetching it per call
+    backend_information = backend_simulator.get_backend_information()
+
+    def run(
+        lattice_sites,
+        global_rabi_frequency,
+        global_phase,
+        global_detuning,
+        local_detuning,
+        init_state=None,
+        backend_options=None,
+        timegrid=None,
+    ) -> SimulationResult:
+        """Run one simulation on the pre-resolved backend; see `simulate`."""
+        lattice_sites = _sites_as_array(lattice_sites)
+        global_rabi_frequency = _as_float_array(global_rabi_frequency)
+        global_phase = _as_float_array(global_phase)
+        global_detuning = _as_float_array(global_detuning)
+        local_detuning = _as_float_array(local_detuning)
+        timegrid = _as_float_array(timegrid)
+        if backend_options is None:
+            backend_options = _EMPTY_OPTS
+        if init_state is not None and not isinstance(init_state, np.ndarray):
+            state = tuple(init_state)
+            # Computational-basis states skip the dense complex conversion;
+            # the caller's sequence is forwarded as-is and backends can
+            # recover the single nonzero index without a 2^N buffer
+            if _basis_state_index(state) is None:
+                # Opt-in single precision halves the state vector's memory
+                # footprint and bandwidth; default stays complex128
+                dtype = (
+                    np.complex64
+                    if backend_options.get("precision", "double") == "single"
+                    else np.complex128
+                )
+                init_state = _to_state_vec(state, dtype)
+
+        try:
+            raw = backend_simulate(
+                lattice_sites=lattice_sites,
+                global_rabi_frequency=global_rabi_frequency,
+                global_phase=global_phase,
+                global_detuning=global_detuning,
+                local_detuning=local_detuning,
+                init_state=init_state,
+                backend_options=backend_options,
+                timegrid=timegrid,
+            )
+            return _as_result(raw, backend_information)
+        except Exception as e:
+            # Catch any exception that occurs during simulation and report it
+            # through the result; the raw exception is stored so the message
+            # is only formatted if the caller actually reads it
+            return SimulationResult(error=e, backend_information=backend_information)
+
+    return run
+
+
+def simulate_many(
+    jobs,
+    backend: str = "Bull",
+    provider: PasquansProvider = None,
+    max_workers: int = None,
+) -> list:
+    """
+    Run several independent simulation jobs against a single backend.
+
+    The backend is resolved once, so the per-call provider lookup and
+    backend-information fetch are amortized over the whole batch, and all
+    returned results share one backend-information mapping. Backends that
+    define a `simulate_batch(jobs)` method receive the whole batch in a
+    single call and can vectorize across jobs (e.g. stack inputs or submit
+    one network request); it must return one result mapping per job, in job
+    order. Otherwise jobs are independent and dispatched to a thread pool,
+    which overlaps I/O-bound backends (e.g. HTTP-based simulators), while
+    serial execution is used for a single job or `max_workers=1`.
+
+    Parameters
+    ----------
+    jobs : Sequence[dict]
+        One keyword-argument dict per job, with the same keys accepted by
+        `simulate` minus `backend` and `provider` (lattice_sites,
+        global_rabi_frequency, ...).
+    backend : str, optional
+        The name of the backend to use for all jobs, default is "Bull".
+    provider : PasquansProvider, optional
+        The provider responsible for managing and retrieving backends. Defaults to a
+        process-wide cached MockProvider instance.
+    max_workers : int, optional
+        Maximum number of worker threads; None lets the executor choose.
+
+    Returns
+    -------
+    list[SimulationResult]
+        One result per job, in job order.
+    """
+    if isinstance(backend, BackendID):
+        backend = _ID_TO_NAME[backend]
+    if provider is None:
+        provider = _default_provider()
+    jobs = list(jobs)
+
+    backend_simulator = provider.get_backend(backend)
+    simulate_batch = getattr(backend_simulator, "simulate_batch", None)
+    if simulate_batch is not None:
+        # The backend sees the whole batch at once and can amortize work
+        # across jobs; per-job dispatch overhead disappears entirely
+        backend_information = backend_simulator.get_backend_information()
+        try:
+            raws = simulate_batch(jobs)
+        except Exception as e:
+            return [
+                SimulationResult(error=e, backend_information=backend_information)
+                for _ in jobs
+            ]
+        return [_as_result(raw, backend_information) for raw in raws]
+
+    run = make_simulator(backend, provider)
+    if max_workers == 1 or len(jobs) <= 1:
+        return [run(**job) for job in jobs]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda job: run(**job), jobs))
+
+
+def simulate(
+    lattice_sites: Union[list[Tuple[float]], np.ndarray],
+    global_rabi_frequency: Union[list[float], np.ndarray],
+    global_phase: Union[list[float], np.ndarray],
+    global_detuning: Union[list[float], np.ndarray],
+    local_detuning: Union[list[float], np.ndarray],
+    init_state: list[float] = None,
+    backend: str = "Bull",
+    backend_options: dict = None,
+    timegrid: Union[list[float], np.ndarray] = None,
+    provider: PasquansProvider = None,
+) -> SimulationResult:
+    """
+    Function to run a quantum simulation on a specified backend.
+
+    This function takes in a variety of parameters describing a quantum system (such as lattice sites,
+    rabi frequencies, phase, and detuning) and runs a simulation on the specified backend. The results
+    of the simulation, along with backend-specific configuration information, are returned in a dictionary.
+    If an error occurs during simulation, it is caught and included in the results.
+
+    Plain Python sequences are converted once to contiguous float64 ndarrays
+    before being forwarded, so backends can rely on SIMD-friendly buffers;
+    pint Quantities are forwarded unchanged so unit-aware backends keep their
+    unit information.
+
+    Parameters
+    ----------
+    lattice_sites : list[Tuple[float]] or np.ndarray
+        The positions of atoms in the lattice, shape (N, D).
+    global_rabi_frequency : list[float] or np.ndarray
+        A time-dependent list of global rabi frequencies used for the simulation.
+    global_phase : list[float] or np.ndarray
+        A time-dependent list of global phase values.
+    global_detuning : list[float] or np.ndarray
+        A time-dependent list of global detuning values.
+    local_detuning : list[float] or np.ndarray
+        A list representing the local detuning for each site specified in the lattice.
+    init_state : list[float], optional
+        An optional list representing the initial state of the system, default is None.
+    backend : str, optional
+        The name of the backend to use for simulation, default is "Bull".
+    backend_options : dict, optional
+        A dictionary of key-value pairs for backend-specific configurations, default is None.
+    timegrid : list[float] or np.ndarray, optional
+        A time grid list for the simulation, default is None.
+    provider : PasquansProvider, optional
+        The provider responsible for managing and retrieving backends. Defaults to a
+        process-wide cached MockProvider instance.
+
+    Returns
+    -------
+    SimulationResult
+        The results of the simulation, supporting mapping-style access, including:
+        - "state_populations": A mock or actual state population result from the simulation.
+        - "backend_options": The backend options used for the simulation.
+        - "backend_information": Metadata about the backend used in the simulation.
+        - "error": Error information, if any exception occurs during the simulation.
+
+    Raises
+    ------
+    SimulationError
+        Raised if a run-time error is encountered during the simulation.
+    JobDescriptionError
+        Raised if the job description provided to the simulation is invalid or incompatible.
+    """
+
+    # Resolve the backend through the factory and run the single job; loops
+    # should call make_simulator() once and reuse the returned closure
+    return make_simulator(backend, provider)(
+        lattice_sites=lattice_sites,
+        global_rabi_frequency=global_rabi_frequency,
+        global_phase=global_phase,
+        global_detuning=global_detuning,
+        local_detuning=local_detuning,
+        init_state=init_state,
+        backend_options=backend_options,
+        timegrid=timegrid,
+    )
@@ -0,0 +1,25 @@
+"""Cached fallback version lookup for installs without a generated _version.py."""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_version() -> str:
+    """Resolve the installed distribution version via package metadata.
+
+    Only used when the build-time generated ``_version.py`` is absent (e.g. a
+    raw checkout on ``sys.path``). The ``lru_cache`` ensures the metadata scan
+    runs at most once per process no matter how often it is called.
+
+    Returns
+    -------
+    str
+        The installed version of ``qruise-pasquans-interface``, or
+        ``"unknown"`` if the distribution metadata cannot be found.
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("qruise-pasquans-interface")
+    except PackageNotFoundError:
+        return "unknown"
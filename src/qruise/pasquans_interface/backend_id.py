@@ -0,0 +1,21 @@
+from enum import IntEnum
+
+
+class BackendID(IntEnum):
+    """
+    Integer identifiers for the built-in backends.
+
+    Sweep loops that dispatch `simulate` by backend can pass one of these tags
+    instead of a string; the tag is lowered to its registry name exactly once
+    at call entry via an index into `_ID_TO_NAME`, keeping string hashing out
+    of the per-call path. Custom backends registered through a provider keep
+    using their string names.
+    """
+
+    MOCK_SIMULATOR = 0
+    MOCK_SIMULATOR_V2 = 1
+
+
+# Index-aligned with the BackendID values above
+_ID_TO_NAME = ("mock_simulator", "mock_simulator_v2")
+_STR_TO_ID = {name: BackendID(index) for index, name in enumerate(_ID_TO_NAME)}
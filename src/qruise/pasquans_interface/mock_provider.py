@@ -2,6 +2,9 @@ from qruise.pasquans_interface.provider import PasquansProvider
 from qruise.pasquans_interface.mock_simulator import MockSimulator, MockSimulatorV2
 from qruise.pasquans_interface.simulator_backend import SimulatorBackend
 
+# Built once at import time; shared by every MockProvider instance
+_SIMULATORS: tuple[type[SimulatorBackend], ...] = (MockSimulator, MockSimulatorV2)
+
 
 class MockProvider(PasquansProvider):
     """
@@ -12,7 +15,9 @@ class MockProvider(PasquansProvider):
     that can be used for simulation tasks without connecting to real backends.
     """
 
-    def _get_simulators(self) -> list[SimulatorBackend]:
+    __slots__ = ()
+
+    def _get_simulators(self) -> tuple[type[SimulatorBackend], ...]:
         """
         Return a list of available simulators.
 
@@ -22,7 +27,7 @@ class MockProvider(PasquansProvider):
 
         Returns
         -------
-        list[SimulatorBackend]
-            A list of available simulators, in this case, containing only the MockSimulator class.
+        tuple[type[SimulatorBackend], ...]
+            The available simulator classes, shared as a module-level tuple.
         """
-        return [MockSimulator, MockSimulatorV2]
+        return _SIMULATORS
@@ -1,6 +1,40 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from .result import SimulationResult
 from .simulator_backend import SimulatorBackend
-from .units import ureg
-from pint import Quantity
+
+if TYPE_CHECKING:
+    from pint import Quantity
+
+# Shared read-only mapping used when a caller passes no backend options, so
+# the default path allocates no per-call dict
+_EMPTY_OPTS = MappingProxyType({})
+
+
+@lru_cache(maxsize=1)
+def _expected_dimensionalities():
+    """Reference ([length], [frequency], [time]) dimensionalities, built once.
+
+    Resolved lazily so importing this module does not trigger pint's unit
+    registry construction; the registry is only needed when the V2 unit
+    checks actually run.
+    """
+    from .units import ureg
+
+    return (
+        ureg.meter.dimensionality,
+        ureg.hertz.dimensionality,
+        ureg.second.dimensionality,
+    )
+
+
+# Constant mock result, preallocated once. Returned as a C-level .copy() so
+# callers keep getting an independent list they are free to mutate.
+_MOCK_POPULATIONS = [0.5, 0.5]
 
 
 class MockSimulator(SimulatorBackend):
@@ -13,6 +47,8 @@ class MockSimulator(SimulatorBackend):
     by returning mock results.
     """
 
+    __slots__ = ("_backend_options", "provider", "name", "_backend_information")
+
     def __init__(self, provider, **backend_options):
         """
         Constructor for the MockSimulator class.
@@ -30,6 +66,15 @@ class MockSimulator(SimulatorBackend):
         self._backend_options = backend_options
         self.provider = provider
         self.name = "mock_simulator"
+        # Static for the lifetime of the instance, so build it once and
+        # freeze it; the read-only proxy is safe to share across callers
+        # and threads
+        self._backend_information = MappingProxyType(
+            {
+                "name": self.name,
+                "backend_options": MappingProxyType(self._backend_options),
+            }
+        )
 
     def simulate(
         self,
@@ -40,8 +85,8 @@ class MockSimulator(SimulatorBackend):
         local_detuning,
         init_state=None,
         timegrid=None,
-        backend_options={},
-    ) -> dict:
+        backend_options=None,
+    ) -> SimulationResult:
         """
         Simulate the system.
 
@@ -67,18 +112,24 @@ class MockSimulator(SimulatorBackend):
         timegrid : list, optional
             An optional list representing the time grid over which the simulation is run. Default is None.
         backend_options : dict, optional
-            A dictionary of options specific to the backend for this simulation.
+            A dictionary of options specific to the backend for this simulation. Default is
+            None, treated as an empty dictionary.
 
         Returns
         -------
-        dict
-            A dictionary containing the simulation results, including state populations
-            and the backend options used in the simulation.
+        SimulationResult
+            The simulation results, including state populations and the
+            backend options used in the simulation. Supports mapping-style
+            access.
         """
-        return {
-            "state_populations": [0.5, 0.5],  # Mocked simulation result
-            "backend_options": backend_options,
-        }
+        if backend_options is None:
+            backend_options = _EMPTY_OPTS
+        # A slotted result object skips the per-call dict allocation and
+        # turns key access into attribute lookup
+        return SimulationResult(
+            state_populations=_MOCK_POPULATIONS.copy(),
+            backend_options=backend_options,
+        )
 
     def get_backend_information(self) -> dict:
         """
@@ -92,10 +143,7 @@ class MockSimulator(SimulatorBackend):
         dict
             A dictionary containing the name of the backend and its configuration options.
         """
-        return {
-            "name": self.name,
-            "backend_options": self._backend_options,
-        }
+        return self._backend_information
 
 
 class MockSimulatorV2(SimulatorBackend):
@@ -108,6 +156,8 @@ class MockSimulatorV2(SimulatorBackend):
     by returning mock results.
     """
 
+    __slots__ = ("_backend_options", "provider", "name", "_backend_information")
+
     def __init__(self, provider, **backend_options):
         """
         Constructor for the MockSimulator class.
@@ -125,6 +175,15 @@ class MockSimulatorV2(SimulatorBackend):
         self._backend_options = backend_options
         self.provider = provider
         self.name = "mock_simulator_v2"
+        # Static for the lifetime of the instance, so build it once and
+        # freeze it; the read-only proxy is safe to share across callers
+        # and threads
+        self._backend_information = MappingProxyType(
+            {
+                "name": self.name,
+                "backend_options": MappingProxyType(self._backend_options),
+            }
+        )
 
     def simulate(
         self,
@@ -135,8 +194,8 @@ class MockSimulatorV2(SimulatorBackend):
         local_detuning: Quantity,
         init_state: list,
         timegrid: Quantity,
-        backend_options={},
-    ) -> dict:
+        backend_options=None,
+    ) -> SimulationResult:
         """
         Simulate the system.
 
@@ -168,41 +227,44 @@ class MockSimulatorV2(SimulatorBackend):
             A Pint Quantity representing the time grid over which the simulation is run. Expected
             to have a unit of [time].
         backend_options : dict, optional
-            A dictionary containing options specific to the simulation backend. Default is an
-            empty dictionary.
+            A dictionary containing options specific to the simulation backend. Default is
+            None, treated as an empty dictionary.
 
         Returns
         -------
-        dict
-            A dictionary containing the following keys:
-            - "populations": List of state populations over time.
-            - "backend_options": The backend options used in the simulation.
+        SimulationResult
+            The simulation results with the state populations over time and
+            the backend options used in the simulation. Supports
+            mapping-style access.
         """
-        # Check if the lattice sites are in a distance unit
-        assert lattice_sites.dimensionality == ureg.meter.dimensionality
-        # Check if the global rabi frequency is in a frequency unit
-        assert global_rabi_frequency.dimensionality == ureg.hertz.dimensionality
-        # Check if the global phase is dimensionless
-        assert global_phase.dimensionless
-        # Check if the global detuning is in a frequency unit
-        assert global_detuning.dimensionality == ureg.hertz.dimensionality
-        # Check if the local detuning is in a frequency unit
-        assert local_detuning.dimensionality == ureg.hertz.dimensionality
-        # Check if the timegrid is in a time unit
-        assert timegrid.dimensionality == ureg.second.dimensionality
-
-        # Convert any units if your simulator requires it
-        lattice_sites = lattice_sites.to(ureg.meter)
-        global_rabi_frequency = global_rabi_frequency.to(ureg.hertz)
-        global_phase = global_phase.to(ureg.dimensionless)
-        global_detuning = global_detuning.to(ureg.hertz)
-        local_detuning = local_detuning.to(ureg.hertz)
-        timegrid = timegrid.to(ureg.second)
-
-        return {
-            "state_populations": [0.5, 0.5],  # Mocked simulation result
-            "backend_options": backend_options,
-        }
+        if backend_options is None:
+            backend_options = _EMPTY_OPTS
+        # Check that the inputs carry [length], [frequency], dimensionless and
+        # [time] units respectively. The whole block is removed under
+        # `python -O`, and the mock skips the `.to(...)` conversions entirely
+        # since the returned populations are constant anyway.
+        if __debug__:
+            dim_length, dim_frequency, dim_time = _expected_dimensionalities()
+            assert (
+                lattice_sites.dimensionality,
+                global_rabi_frequency.dimensionality,
+                global_phase.dimensionless,
+                global_detuning.dimensionality,
+                local_detuning.dimensionality,
+                timegrid.dimensionality,
+            ) == (
+                dim_length,
+                dim_frequency,
+                True,
+                dim_frequency,
+                dim_frequency,
+                dim_time,
+            ), "simulate() inputs have unexpected dimensionality"
+
+        return SimulationResult(
+            state_populations=_MOCK_POPULATIONS.copy(),
+            backend_options=backend_options,
+        )
 
     def get_backend_information(self) -> dict:
         """
@@ -216,7 +278,4 @@ class MockSimulatorV2(SimulatorBackend):
         dict
             A dictionary containing the name of the backend and its configuration options.
         """
-        return {
-            "name": self.name,
-            "backend_options": self._backend_options,
-        }
+        return self._backend_information
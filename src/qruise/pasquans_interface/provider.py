@@ -14,13 +14,23 @@ class PasquansProvider(ABC):
         The name of the provider instance, initialized as 'pasquans_qruise_provider'.
     _backends : dict
         A dictionary storing backend instances keyed by backend names.
+    _backend_list : tuple
+        All backend instances, precomputed once so `backends()` does not
+        rebuild a list on every call.
+    _scratch : dict
+        Reusable work buffers keyed by (shape, dtype), handed out by
+        `scratch_buffer()`.
     """
 
+    __slots__ = ("name", "_backends", "_backend_list", "_scratch")
+
     def __init__(self):
         """Initialize the provider and verify the available backends."""
         super().__init__()
         self.name = "pasquans_qruise_provider"
         self._backends = self._verify_backends()
+        self._backend_list = tuple(self._backends.values())
+        self._scratch = {}
 
     @abstractmethod
     def _get_simulators(self) -> list:
@@ -53,23 +63,22 @@ class PasquansProvider(ABC):
 
         Returns
         -------
-        list[SimulatorBackend]
-            A list of backend instances matching the specified name, or all backends if no name is provided.
+        tuple[SimulatorBackend]
+            The backend instances matching the specified name, or all backends if no name is provided.
 
         Raises
         ------
         ValueError
             If the specified backend name is not found.
         """
-        backends = list(self._backends.values())
-        if name:
-            try:
-                backends = [self._backends[name]]
-            except LookupError:
-                raise ValueError(
-                    "The '{}' backend is not installed in your system.".format(name)
-                )
-        return backends
+        if not name:
+            return self._backend_list
+        backend = self._backends.get(name)
+        if backend is None:
+            raise ValueError(
+                "The '{}' backend is not installed in your system.".format(name)
+            )
+        return (backend,)
 
     def _verify_backends(self):
         """Instantiate and verify available backends.
@@ -118,6 +127,42 @@ class PasquansProvider(ABC):
             )
         return backend_instance
 
+    def scratch_buffer(self, shape, dtype="complex128"):
+        """Return a reusable uninitialized work buffer of the given shape/dtype.
+
+        Sweep loops that call `simulate()` thousands of times pay a
+        `malloc` + `memset` per call for every amplitude buffer a backend
+        allocates; at large system sizes that allocation dominates
+        wall-clock time. Buffers handed out here are cached on the provider
+        keyed by (shape, dtype) and returned as-is on subsequent calls, so a
+        backend that opts in allocates each buffer once per provider and
+        zeroes it with ``buf.fill(0)`` when needed.
+
+        The contents are unspecified on every call, and the same buffer is
+        returned for the same key, so opting-in backends must not rely on
+        buffers surviving across concurrent jobs.
+
+        Parameters
+        ----------
+        shape : int or tuple[int]
+            Shape of the requested buffer.
+        dtype : data-type, optional
+            NumPy dtype of the buffer, default "complex128".
+
+        Returns
+        -------
+        np.ndarray
+            An uninitialized array of the requested shape and dtype, shared
+            across calls with the same key.
+        """
+        import numpy as np
+
+        key = (shape, np.dtype(dtype))
+        buf = self._scratch.get(key)
+        if buf is None:
+            buf = self._scratch[key] = np.empty(shape, dtype)
+        return buf
+
     def get_backend(self, name=None, **kwargs):
         """Retrieve a single backend instance matching the specified filtering criteria.
 
@@ -142,6 +187,14 @@ class PasquansProvider(ABC):
         ValueError
             If no backends match the filtering criteria or more than one backend matches.
         """
+        if name is not None and not kwargs:
+            # Fast path: a named lookup is a single dict access
+            backend = self._backends.get(name)
+            if backend is None:
+                raise ValueError(
+                    "The '{}' backend is not installed in your system.".format(name)
+                )
+            return backend
         backends = self.backends(name, **kwargs)
         if len(backends) > 1:
             raise ValueError("More than one backend matches the criteria")
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+
+
+@dataclass(slots=True)
+class SimulationResult:
+    """
+    Lightweight container for the outcome of a simulation run.
+
+    This class replaces the plain dict previously returned by `simulate`. The
+    slotted dataclass avoids the per-call dict allocation and string hashing,
+    while `__getitem__`, `__contains__`, `get` and `to_dict` keep the familiar
+    mapping-style access working, so `result["state_populations"]` and
+    `"error" not in result` behave exactly as before. A field set to None is
+    treated as absent, mirroring the old dict where unset keys were omitted.
+
+    Attributes:
+    -----------
+    state_populations : Any
+        The state populations produced by the backend, or None if the
+        simulation failed.
+    backend_options : Mapping, optional
+        The backend options the simulation ran with.
+    backend_information : Mapping, optional
+        Metadata about the backend used for the simulation.
+    error : Any, optional
+        The exception raised by the backend if the simulation failed, None
+        otherwise. Stored unformatted — use `format_error` to render it —
+        so the failure path never pays for message formatting the caller may
+        never read.
+    extra : Mapping, optional
+        Any additional keys a backend returned beyond the recognized fields.
+        Third-party backends are free to report backend-specific data; those
+        keys stay reachable through the mapping-style access and `to_dict`,
+        as they were when results were plain dicts.
+    """
+
+    state_populations: Any = None
+    backend_options: Optional[Mapping] = None
+    backend_information: Optional[Mapping] = None
+    error: Any = None
+    extra: Optional[Mapping] = None
+
+    def __getitem__(self, key: str):
+        value = getattr(self, key, None)
+        if value is None:
+            if self.extra is not None and key in self.extra:
+                return self.extra[key]
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        if getattr(self, key, None) is not None:
+            return True
+        return self.extra is not None and key in self.extra
+
+    def get(self, key: str, default=None):
+        """Return the value for `key`, or `default` if it is absent."""
+        value = getattr(self, key, None)
+        if value is not None:
+            return value
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        return default
+
+    def to_dict(self) -> dict:
+        """Return the result as a plain dict, omitting absent fields.
+
+        Extra backend-specific keys are flattened into the dict alongside
+        the recognized fields.
+        """
+        out = {
+            key: value
+            for key in self.__slots__
+            if key != "extra" and (value := getattr(self, key)) is not None
+        }
+        if self.extra:
+            out.update(self.extra)
+        return out
+
+
+def format_error(result: SimulationResult) -> Optional[str]:
+    """
+    Render the error stored in a result as a human-readable string.
+
+    `simulate` stores the raw exception object in `SimulationResult.error`
+    rather than formatting it eagerly; this helper performs the formatting on
+    demand for callers that want to log or display the failure.
+
+    Parameters
+    ----------
+    result : SimulationResult
+        The result whose error should be rendered.
+
+    Returns
+    -------
+    str or None
+        A "ExceptionType: message" string, or None if the simulation
+        succeeded.
+    """
+    error = result.error
+    if error is None:
+        return None
+    if isinstance(error, BaseException):
+        return f"{type(error).__name__}: {error}"
+    return str(error)
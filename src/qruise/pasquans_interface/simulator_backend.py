@@ -1,14 +1,19 @@
-from abc import ABC, abstractmethod
-from typing import Tuple
+from __future__ import annotations
 
+from typing import TYPE_CHECKING, Tuple, Union
 
-class SimulatorBackend(ABC):
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class SimulatorBackend:
     """
-    Abstract Base Class (ABC) representing a backend for simulators.
+    Base class representing a backend for simulators.
 
     This class defines the interface for simulator backends, requiring any subclass to implement
     core functionalities such as initialization, running simulations, and retrieving backend-specific
-    information. It ensures consistency across all backends that inherit from it.
+    information. The base methods raise NotImplementedError, so the contract is enforced at call
+    time rather than through ABCMeta, which keeps subclass instantiation free of metaclass checks.
 
     Attributes:
     -----------
@@ -16,12 +21,14 @@ class SimulatorBackend(ABC):
         The name of the backend, which should be initialized in the subclass.
     """
 
+    # Empty slots so concrete backends declaring __slots__ stay __dict__-free
+    __slots__ = ()
+
     name: str
 
-    @abstractmethod
     def __init__(self, provider, **backend_options):
         """
-        Abstract constructor to initialize the backend.
+        Constructor to initialize the backend; must be overridden.
 
         This method must be implemented by any subclass to handle backend-specific initialization logic.
         It typically involves setting up backend attributes, configurations, and managing any other
@@ -41,16 +48,15 @@ class SimulatorBackend(ABC):
         """
         raise NotImplementedError("Method not implemented")
 
-    @abstractmethod
     def simulate(
         self,
-        lattice_sites: list[Tuple[float]],
-        global_rabi_frequency: list[float],
-        global_phase: list[float],
-        global_detuning: list[float],
-        local_detuning: list[float],
+        lattice_sites: Union[list[Tuple[float]], np.ndarray],
+        global_rabi_frequency: Union[list[float], np.ndarray],
+        global_phase: Union[list[float], np.ndarray],
+        global_detuning: Union[list[float], np.ndarray],
+        local_detuning: Union[list[float], np.ndarray],
         init_state: list[float] = None,
-        timegrid: list[float] = None,
+        timegrid: Union[list[float], np.ndarray] = None,
     ) -> dict:
         """
         Run the simulation on the backend.
@@ -61,19 +67,20 @@ class SimulatorBackend(ABC):
 
         Parameters
         ----------
-        lattice_sites : list[Tuple[float]]
-            A list of tuples representing the positions of atoms in the lattice.
-        global_rabi_frequency : list[float]
+        lattice_sites : list[Tuple[float]] or np.ndarray
+            The positions of atoms in the lattice, shape (N, D). The `simulate`
+            entry point forwards plain sequences as contiguous float64 arrays.
+        global_rabi_frequency : list[float] or np.ndarray
             A time-dependent list of global rabi frequencies used for the simulation.
-        global_phase : list[float]
+        global_phase : list[float] or np.ndarray
             A time-dependent list of global phase values.
-        global_detuning : list[float]
+        global_detuning : list[float] or np.ndarray
             A time-dependent list of global detuning values.
-        local_detuning : list[float]
+        local_detuning : list[float] or np.ndarray
             A list representing the local detuning for each site specified in the lattice.
         init_state : list[float], optional
             An optional list representing the initial state of the system, with the ground state as the default.
-        timegrid : list[float], optional
+        timegrid : list[float] or np.ndarray, optional
             An optional list defining the time grid over which the simulation is executed.
 
         Returns
@@ -91,7 +98,6 @@ class SimulatorBackend(ABC):
         """
         raise NotImplementedError("Method not implemented")
 
-    @abstractmethod
     def get_backend_information(self) -> dict:
         """
         Retrieve information about the backend.
@@ -1,4 +1,82 @@
+import functools
+import inspect
+
 import pint
 
 ureg = pint.UnitRegistry()
 Q_ = ureg.Quantity
+
+
+def validate_units(**specs):
+    """Build a decorator that validates Quantity arguments against unit specs.
+
+    Unit-aware simulators otherwise inline the same block of dimensionality
+    asserts and conversions in every ``simulate`` implementation; this
+    decorator runs the checks from a spec that is parsed once at decoration
+    time, so the per-call work is a dimensionality comparison per argument
+    instead of re-parsing unit strings.
+
+    Each keyword maps a parameter name to either a dimensionality string
+    (e.g. ``"[length]"``), which only validates, or a unit expression
+    (e.g. ``"meter"``), which validates and then replaces the argument with
+    its raw magnitude in that unit via ``.m_as()`` — so the wrapped function
+    body works with bare ndarrays.
+
+    Parameters
+    ----------
+    **specs : str
+        Mapping of parameter names to dimensionality strings or unit
+        expressions.
+
+    Returns
+    -------
+    Callable
+        A decorator for ``simulate``-style functions and methods.
+
+    Raises
+    ------
+    ValueError
+        At call time, if an argument is missing units or carries the wrong
+        dimensionality.
+    """
+    parsed = {}
+    for param, spec in specs.items():
+        if spec.startswith("["):
+            parsed[param] = (ureg.get_dimensionality(spec), None)
+        else:
+            unit = ureg.Unit(spec)
+            parsed[param] = (unit.dimensionality, unit)
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            for param, (expected, unit) in parsed.items():
+                value = bound.arguments.get(param)
+                if value is None:
+                    continue
+                try:
+                    dimensionality = value.dimensionality
+                except AttributeError:
+                    raise ValueError(
+                        "'{}' must be a Quantity with dimensionality {}".format(
+                            param, expected
+                        )
+                    ) from None
+                # Identity hit first: pint interns common dimensionality
+                # containers, so matching units skip the equality walk
+                if dimensionality is not expected and dimensionality != expected:
+                    raise ValueError(
+                        "'{}' has dimensionality {}, expected {}".format(
+                            param, dimensionality, expected
+                        )
+                    )
+                if unit is not None:
+                    bound.arguments[param] = value.m_as(unit)
+            return func(*bound.args, **bound.kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,58 @@
+import subprocess
+import sys
+
+_PACKAGE_IMPORT_SNIPPET = """
+import sys
+import qruise.pasquans_interface
+assert "pint" not in sys.modules, "package import pulled in pint"
+"""
+
+_PLAIN_SIMULATE_SNIPPET = """
+import sys
+from qruise.pasquans_interface import simulate, MockProvider
+
+result = simulate(
+    lattice_sites=[(0.0, 0.0), (1.0, 1.0)],
+    global_rabi_frequency=[1.0, 1.0],
+    global_phase=[0.0, 0.0],
+    global_detuning=[0.0, 0.0],
+    local_detuning=[0.0, 0.0],
+    init_state=[1.0, 0.0],
+    timegrid=[0.0, 1.0],
+    backend="mock_simulator",
+    backend_options={},
+    provider=MockProvider(),
+)
+assert result["state_populations"] == [0.5, 0.5]
+assert "pint" not in sys.modules, "plain-list simulate pulled in pint"
+"""
+
+
+_IMPORT_ORDER_SNIPPET = """
+from qruise.pasquans_interface._simulate import make_simulator
+from qruise.pasquans_interface import simulate
+assert callable(simulate), "public simulate name resolved to a module"
+"""
+
+
+def _run_in_fresh_interpreter(snippet):
+    return subprocess.run(
+        [sys.executable, "-c", snippet], capture_output=True, text=True
+    )
+
+
+def test_package_import_does_not_load_pint():
+    proc = _run_in_fresh_interpreter(_PACKAGE_IMPORT_SNIPPET)
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_plain_list_simulate_does_not_load_pint():
+    proc = _run_in_fresh_interpreter(_PLAIN_SIMULATE_SNIPPET)
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_simulate_name_survives_direct_submodule_import():
+    # Importing the defining submodule first must not shadow the public
+    # simulate function with a module object
+    proc = _run_in_fresh_interpreter(_IMPORT_ORDER_SNIPPET)
+    assert proc.returncode == 0, proc.stderr
@@ -0,0 +1,61 @@
+from qruise.pasquans_interface import make_simulator, MockProvider, SimulationResult
+import numpy as np
+
+from qruise.pasquans_interface._simulate import _basis_state_index, _to_state_vec
+
+
+def test_make_simulator_reuses_backend():
+    run = make_simulator("mock_simulator", provider=MockProvider())
+    for _ in range(3):
+        result = run(
+            lattice_sites=[(0.0, 0.0), (1.0, 1.0)],
+            global_rabi_frequency=[1.0, 1.0],
+            global_phase=[0.0, 0.0],
+            global_detuning=[0.0, 0.0],
+            local_detuning=[0.0, 0.0],
+            init_state=[1.0, 0.0],
+            timegrid=[0.0, 1.0],
+            backend_options={},
+        )
+        assert isinstance(result, SimulationResult)
+        assert result["state_populations"] == [0.5, 0.5]
+        assert result["backend_information"]["name"] == "mock_simulator"
+        assert "error" not in result
+
+
+def test_make_simulator_reports_backend_errors():
+    run = make_simulator("mock_simulator_v2", provider=MockProvider())
+    # Plain lists have no dimensionality, so the V2 unit checks must fail and
+    # surface through the error field
+    result = run(
+        lattice_sites=[(0.0, 0.0), (1.0, 1.0)],
+        global_rabi_frequency=[1.0, 1.0],
+        global_phase=[0.0, 0.0],
+        global_detuning=[0.0, 0.0],
+        local_detuning=[0.0, 0.0],
+        init_state=[1.0, 0.0],
+        timegrid=[0.0, 1.0],
+    )
+    assert "error" in result
+    assert "state_populations" not in result
+
+
+def test_basis_state_index_detection():
+    assert _basis_state_index((1.0, 0.0)) == 0
+    assert _basis_state_index((0.0, 0.0, 1.0)) == 2
+    # Null, unnormalized and superposition states are not basis states
+    assert _basis_state_index((0.0, 0.0)) is None
+    assert _basis_state_index((1.0, 1.0)) is None
+    assert _basis_state_index((0.5, 0.5)) is None
+
+
+def test_state_vec_precision_selected_by_dtype():
+    state = (0.6, 0.8)
+    double = _to_state_vec(state)
+    single = _to_state_vec(state, np.complex64)
+    assert double.dtype == np.complex128
+    assert single.dtype == np.complex64
+    # The dtype is part of the cache key, so the two vectors are cached
+    # independently
+    assert _to_state_vec(state) is double
+    assert _to_state_vec(state, np.complex64) is single
@@ -0,0 +1,18 @@
+import numpy as np
+
+from qruise.pasquans_interface import pair_distances
+
+
+def test_pair_distances_matches_norm():
+    sites = np.array([(0.0, 0.0), (3.0, 4.0), (6.0, 8.0)])
+    distances = pair_distances(sites)
+    expected = np.linalg.norm(sites[:, None, :] - sites[None, :, :], axis=-1)
+    assert distances.shape == (3, 3)
+    np.testing.assert_allclose(distances, expected)
+    np.testing.assert_allclose(np.diag(distances), 0.0)
+
+
+def test_pair_distances_accepts_list_of_tuples():
+    distances = pair_distances([(0.0, 0.0), (1.0, 1.0)])
+    np.testing.assert_allclose(distances[0, 1], np.sqrt(2.0))
+    np.testing.assert_allclose(distances, distances.T)
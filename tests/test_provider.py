@@ -0,0 +1,14 @@
+import numpy as np
+
+from qruise.pasquans_interface import MockProvider
+
+
+def test_scratch_buffer_is_reused_per_shape_and_dtype():
+    provider = MockProvider()
+    buf = provider.scratch_buffer(4)
+    assert buf.shape == (4,)
+    assert buf.dtype == np.complex128
+    # Same key returns the same buffer; a different shape or dtype does not
+    assert provider.scratch_buffer(4) is buf
+    assert provider.scratch_buffer(8) is not buf
+    assert provider.scratch_buffer(4, np.float64) is not buf
@@ -0,0 +1,19 @@
+import numpy as np
+
+from qruise.pasquans_interface import Q_, pulses_are_constant
+
+
+def test_constant_pulses_are_detected():
+    assert pulses_are_constant([1.0, 1.0], [0.0, 0.0], None)
+    assert pulses_are_constant(np.zeros(100))
+    assert pulses_are_constant()
+
+
+def test_varying_pulse_is_not_constant():
+    assert not pulses_are_constant([1.0, 1.0], [0.0, 0.5])
+    assert not pulses_are_constant(np.linspace(0.0, 1.0, 10))
+
+
+def test_quantity_pulses_compare_on_magnitudes():
+    assert pulses_are_constant(np.array([1.0, 1.0]) * Q_("MHz"))
+    assert not pulses_are_constant(np.array([1.0, 2.0]) * Q_("MHz"))
@@ -5,6 +5,12 @@ from qruise.pasquans_interface import PasquansProvider
 from pint import Quantity
 from typing import List, Tuple
 
+# Expected dimensionalities, computed once at import time so simulate() does
+# not rebuild them on every call
+DIM_LENGTH = ureg.meter.dimensionality
+DIM_FREQUENCY = ureg.hertz.dimensionality
+DIM_TIME = ureg.second.dimensionality
+
 
 def test_simulate_function_in_readme():
     result = simulate(
@@ -230,26 +236,23 @@ def test_custom_provider_and_simulator_v2_in_readme():
                 - "populations": List of state populations over time.
                 - "backend_options": The backend options used in the simulation.
             """
-            # Check if the lattice sites are in a distance unit
-            assert lattice_sites.dimensionality == ureg.meter.dimensionality
-            # Check if the global rabi frequency is in a frequency unit
-            assert global_rabi_frequency.dimensionality == ureg.hertz.dimensionality
-            # Check if the global phase is dimensionless
+            # Check the inputs against the precomputed reference dimensionalities
+            assert lattice_sites.dimensionality == DIM_LENGTH
+            assert global_rabi_frequency.dimensionality == DIM_FREQUENCY
             assert global_phase.dimensionless
-            # Check if the global detuning is in a frequency unit
-            assert global_detuning.dimensionality == ureg.hertz.dimensionality
-            # Check if the local detuning is in a frequency unit
-            assert local_detuning.dimensionality == ureg.hertz.dimensionality
-            # Check if the timegrid is in a time unit
-            assert timegrid.dimensionality == ureg.second.dimensionality
-
-            # Convert any units if your simulator requires it
-            lattice_sites = lattice_sites.to(ureg.meter)
-            global_rabi_frequency = global_rabi_frequency.to(ureg.hertz)
-            global_phase = global_phase.to(ureg.dimensionless)
-            global_detuning = global_detuning.to(ureg.hertz)
-            local_detuning = local_detuning.to(ureg.hertz)
-            timegrid = timegrid.to(ureg.second)
+            assert global_detuning.dimensionality == DIM_FREQUENCY
+            assert local_detuning.dimensionality == DIM_FREQUENCY
+            assert timegrid.dimensionality == DIM_TIME
+
+            # Extract the raw magnitudes scaled to the target units; .m_as()
+            # returns the bare ndarray and skips the Quantity wrapper that
+            # .to() allocates, which is all a numeric core needs
+            lattice_sites_m = lattice_sites.m_as(ureg.meter)  # noqa: F841
+            rabi_hz = global_rabi_frequency.m_as(ureg.hertz)  # noqa: F841
+            phase = global_phase.m_as(ureg.dimensionless)  # noqa: F841
+            detuning_hz = global_detuning.m_as(ureg.hertz)  # noqa: F841
+            local_detuning_hz = local_detuning.m_as(ureg.hertz)  # noqa: F841
+            timegrid_s = timegrid.m_as(ureg.second)  # noqa: F841
 
             # Example of running the simulation with mock data
             state_populations = [0.7, 0.3]  # Mock result for demonstration
@@ -1,11 +1,14 @@
+import numpy as np
+import pytest
+
 from qruise.pasquans_interface import simulate
+from qruise.pasquans_interface import BackendID
 from qruise.pasquans_interface import MockProvider
 from qruise.pasquans_interface import Q_
-import numpy as np
 
 
-def test_simulate():
-    result = simulate(
+def _plain_list_job():
+    return dict(
         lattice_sites=[(0.0, 0.0, 0.0), (1.0, 1.0, 1.0)],
         global_rabi_frequency=[1.0, 1.0],
         global_phase=[0.0, 0.0],
@@ -13,17 +16,12 @@ def test_simulate():
         local_detuning=[0.0, 0.0],
         init_state=[0.0, 0.0],
         timegrid=[0.0, 1.0],
-        backend="mock_simulator",
         backend_options={},
-        provider=MockProvider(),
     )
-    assert result["state_populations"] == [0.5, 0.5]
-    assert result["backend_options"] == {}
-    assert "error" not in result
 
 
-def test_simulate_v2():
-    result = simulate(
+def _quantity_job():
+    return dict(
         lattice_sites=np.array([(0.0, 0.0, 0.0), (1.0, 1.0, 1.0)]) * Q_("micrometer"),
         global_rabi_frequency=np.array([1.0, 1.0]) * Q_("MHz"),
         global_phase=np.array([0.0, 0.0]) * Q_("rad"),
@@ -31,11 +29,25 @@ def test_simulate_v2():
         local_detuning=np.array([0.0, 0.0]) * Q_("MHz"),
         init_state=[0.0, 0.0],
         timegrid=[0.0, 1.0] * Q_("microsecond"),
-        backend="mock_simulator_v2",
         backend_options={},
-        provider=MockProvider(),
     )
-    assert "error" not in result
 
+
+@pytest.mark.parametrize(
+    ("backend", "make_job"),
+    [
+        ("mock_simulator", _plain_list_job),
+        ("mock_simulator_v2", _quantity_job),
+        (BackendID.MOCK_SIMULATOR, _plain_list_job),
+    ],
+    ids=["plain-lists", "quantities", "backend-id"],
+)
+def test_simulate(backend, make_job):
+    result = simulate(
+        backend=backend,
+        provider=MockProvider(),
+        **make_job(),
+    )
     assert result["state_populations"] == [0.5, 0.5]
     assert result["backend_options"] == {}
+    assert "error" not in result
@@ -0,0 +1,75 @@
+from qruise.pasquans_interface import (
+    simulate_many,
+    MockProvider,
+    MockSimulator,
+    PasquansProvider,
+)
+
+
+def _job(rabi):
+    return {
+        "lattice_sites": [(0.0, 0.0), (1.0, 1.0)],
+        "global_rabi_frequency": [rabi, rabi],
+        "global_phase": [0.0, 0.0],
+        "global_detuning": [0.0, 0.0],
+        "local_detuning": [0.0, 0.0],
+        "init_state": [1.0, 0.0],
+        "timegrid": [0.0, 1.0],
+        "backend_options": {},
+    }
+
+
+def test_simulate_many():
+    results = simulate_many(
+        [_job(rabi) for rabi in (0.5, 1.0, 1.5)],
+        backend="mock_simulator",
+        provider=MockProvider(),
+    )
+    assert len(results) == 3
+    for result in results:
+        assert result["state_populations"] == [0.5, 0.5]
+        assert "error" not in result
+    # The backend information is resolved once and shared across the batch
+    assert all(
+        r["backend_information"] is results[0]["backend_information"] for r in results
+    )
+
+
+def test_simulate_many_serial():
+    results = simulate_many(
+        [_job(1.0)],
+        backend="mock_simulator",
+        provider=MockProvider(),
+        max_workers=1,
+    )
+    assert len(results) == 1
+    assert results[0]["state_populations"] == [0.5, 0.5]
+
+
+def test_simulate_many_prefers_backend_batch_hook():
+    class BatchingSimulator(MockSimulator):
+        def simulate_batch(self, jobs):
+            return [
+                {
+                    "state_populations": [0.5, 0.5],
+                    "backend_options": job["backend_options"],
+                    "batched": True,
+                }
+                for job in jobs
+            ]
+
+    class BatchingProvider(PasquansProvider):
+        def _get_simulators(self):
+            return [BatchingSimulator]
+
+    results = simulate_many(
+        [_job(rabi) for rabi in (0.5, 1.0)],
+        backend="mock_simulator",
+        provider=BatchingProvider(),
+    )
+    assert len(results) == 2
+    for result in results:
+        assert result["state_populations"] == [0.5, 0.5]
+        assert "error" not in result
+        # Keys beyond the recognized fields survive the wrapping
+        assert result["batched"] is True
@@ -0,0 +1,87 @@
+import pytest
+from qruise.pasquans_interface import (
+    SimulationResult,
+    format_error,
+    simulate,
+    MockProvider,
+    PasquansProvider,
+    SimulatorBackend,
+)
+
+
+def test_mapping_style_access():
+    result = SimulationResult(
+        state_populations=[0.5, 0.5],
+        backend_options={},
+        backend_information={"name": "mock_simulator"},
+    )
+    assert result["state_populations"] == [0.5, 0.5]
+    assert result["backend_information"]["name"] == "mock_simulator"
+    assert "error" not in result
+    assert result.get("error") is None
+    with pytest.raises(KeyError):
+        result["error"]
+
+
+def test_to_dict_omits_absent_fields():
+    result = SimulationResult(state_populations=[0.5, 0.5])
+    assert result.to_dict() == {"state_populations": [0.5, 0.5]}
+
+
+def test_format_error():
+    assert format_error(SimulationResult(state_populations=[0.5, 0.5])) is None
+    failed = SimulationResult(error=ValueError("bad lattice"))
+    assert format_error(failed) == "ValueError: bad lattice"
+
+
+def test_simulate_returns_simulation_result():
+    result = simulate(
+        lattice_sites=[(0.0, 0.0), (1.0, 1.0)],
+        global_rabi_frequency=[1.0, 1.0],
+        global_phase=[0.0, 0.0],
+        global_detuning=[0.0, 0.0],
+        local_detuning=[0.0, 0.0],
+        init_state=[1.0, 0.0],
+        timegrid=[0.0, 1.0],
+        backend="mock_simulator",
+        backend_options={},
+        provider=MockProvider(),
+    )
+    assert isinstance(result, SimulationResult)
+    assert result["state_populations"] == [0.5, 0.5]
+    assert result.state_populations == [0.5, 0.5]
+
+
+def test_unrecognized_backend_keys_are_preserved():
+    class ExtraSimulator(SimulatorBackend):
+        def __init__(self, provider=None, **backend_options):
+            self.name = "extra_simulator"
+
+        def simulate(self, **kwargs):
+            return {"state_populations": [0.5, 0.5], "fidelity": 0.99}
+
+        def get_backend_information(self):
+            return {"name": self.name}
+
+    class ExtraProvider(PasquansProvider):
+        def _get_simulators(self):
+            return [ExtraSimulator]
+
+    result = simulate(
+        lattice_sites=[(0.0, 0.0), (1.0, 1.0)],
+        global_rabi_frequency=[1.0, 1.0],
+        global_phase=[0.0, 0.0],
+        global_detuning=[0.0, 0.0],
+        local_detuning=[0.0, 0.0],
+        init_state=[1.0, 0.0],
+        timegrid=[0.0, 1.0],
+        backend="extra_simulator",
+        backend_options={},
+        provider=ExtraProvider(),
+    )
+    # Backend-specific keys stay reachable, exactly as with the old dicts
+    assert "fidelity" in result
+    assert result["fidelity"] == 0.99
+    assert result.get("fidelity") == 0.99
+    assert result.to_dict()["fidelity"] == 0.99
+    assert result["state_populations"] == [0.5, 0.5]
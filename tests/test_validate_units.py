@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from qruise.pasquans_interface import Q_, validate_units
+
+
+@validate_units(
+    lattice_sites="meter",
+    global_rabi_frequency="hertz",
+    timegrid="[time]",
+)
+def _run(lattice_sites, global_rabi_frequency, timegrid=None):
+    return lattice_sites, global_rabi_frequency, timegrid
+
+
+def test_validate_units_converts_to_magnitudes():
+    sites, rabi, timegrid = _run(
+        lattice_sites=np.array([(0.0, 0.0), (1.0, 1.0)]) * Q_("micrometer"),
+        global_rabi_frequency=np.array([1.0, 1.0]) * Q_("MHz"),
+        timegrid=np.array([0.0, 1.0]) * Q_("microsecond"),
+    )
+    # Unit-expression specs inject raw magnitudes in the target unit
+    assert not hasattr(sites, "units")
+    np.testing.assert_allclose(sites[1], [1e-6, 1e-6])
+    np.testing.assert_allclose(rabi, [1e6, 1e6])
+    # Dimensionality-only specs validate but keep the Quantity
+    assert hasattr(timegrid, "units")
+
+
+def test_validate_units_rejects_wrong_dimensionality():
+    with pytest.raises(ValueError, match="lattice_sites"):
+        _run(
+            lattice_sites=np.array([(0.0, 0.0)]) * Q_("second"),
+            global_rabi_frequency=np.array([1.0]) * Q_("MHz"),
+        )
+
+
+def test_validate_units_rejects_unitless_input():
+    with pytest.raises(ValueError, match="global_rabi_frequency"):
+        _run(
+            lattice_sites=np.array([(0.0, 0.0)]) * Q_("meter"),
+            global_rabi_frequency=[1.0],
+        )